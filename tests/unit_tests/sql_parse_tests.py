@@ -610,7 +610,7 @@ FROM (
         WHERE 1=1
         GROUP BY
             not_table.bad_col1 ,
-            not_table.bad_col2 ,
+            not_table.bad_col2
         ORDER BY not_table.bad_col_3 DESC ,
             not_table.bad_col4 ,
             not_table.bad_col5
@@ -624,7 +624,6 @@ FROM (
     UNION ALL SELECT lets_go_deeper
     FROM f
     WHERE 1=1
-    WHERE 2=2
     GROUP BY last_col
     LIMIT 50000
 )
@@ -2005,6 +2004,29 @@ def test_kustokql_statement_split_special(kql: str, statements: int) -> None:
     assert len(KustoKQLStatement.split_query(kql, "kustokql")) == statements
 
 
+@pytest.mark.parametrize(
+    "kql,expected",
+    [
+        # semi-colons inside multi-line strings are not statement separators
+        ("```foo;bar```; baz", ["```foo;bar```", " baz"]),
+        ("print ```;```", ["print ```;```"]),
+        # multi-line string delimiters at the very start of the query
+        ("``` a; b ```; c", ["``` a; b ```", " c"]),
+        # a lone backtick is not a string delimiter
+        ("`; a", ["`", " a"]),
+        # quoted strings at the very start of the query
+        ("';' | x; y", ["';' | x", " y"]),
+        # empty statements between consecutive semi-colons are preserved
+        ("a;;b", ["a", "", "b"]),
+    ],
+)
+def test_split_kql_special(kql: str, expected: list[str]) -> None:
+    """
+    Test `split_kql` with tricky string delimiters.
+    """
+    assert split_kql(kql) == expected
+
+
 def test_split_kql() -> None:
     """
     Test the `split_kql` function.
@@ -2070,6 +2092,7 @@ on $left.Day1 == $right.Day
         ("sqlite", "DELETE FROM foo WHERE id = 1", True),
         ("sqlite", "CREATE TABLE foo (id INT, bar TEXT)", True),
         ("sqlite", "DROP TABLE foo", True),
+        ("sqlite", "ALTER TABLE foo ADD COLUMN bar TEXT", True),
         ("sqlite", "EXPLAIN SELECT * FROM foo", False),
         ("sqlite", "PRAGMA table_info(foo)", False),
         ("postgresql", "SELECT 1", False),
@@ -2078,6 +2101,9 @@ on $left.Day1 == $right.Day
         ("postgresql", "DELETE FROM foo WHERE id = 1", True),
         ("postgresql", "CREATE TABLE foo (id SERIAL PRIMARY KEY, bar TEXT)", True),
         ("postgresql", "DROP TABLE foo", True),
+        ("postgresql", "ALTER TABLE foo ADD COLUMN bar TEXT", True),
+        ("postgresql", "ALTER VIEW foo AS SELECT * FROM bar", True),
+        ("postgresql", "ALTER INDEX foo RENAME TO bar", True),
         ("postgresql", "EXPLAIN ANALYZE SELECT * FROM foo", False),
         ("postgresql", "EXPLAIN ANALYZE DELETE FROM foo", True),
         ("postgresql", "SHOW search_path", False),
@@ -2098,6 +2124,7 @@ on $left.Day1 == $right.Day
         ("trino", "DELETE FROM foo WHERE id = 1", True),
         ("trino", "CREATE TABLE foo (id INT, bar VARCHAR)", True),
         ("trino", "DROP TABLE foo", True),
+        ("trino", "ALTER TABLE foo RENAME TO bar", True),
         ("trino", "EXPLAIN SELECT * FROM foo", False),
         ("trino", "SHOW SCHEMAS", False),
         ("trino", "SET SESSION optimization_level = '3'", False),